@@ -50,9 +50,9 @@ svm.setup(C=100.0,
           gamma='scale',
           random_state=42
           )
-gbm.setup(loss='exponential',
+gbm.setup(loss='log_loss',
           learning_rate=0.1,
-          n_estimators=300,
+          max_iter=300,
           max_depth=5,
           random_state=42
           )
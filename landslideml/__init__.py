@@ -2,6 +2,15 @@
 Basic package for landslide susceptibility modeling using machine learning.
 """
 
+# Accelerate the sklearn estimators with Intel oneDAL when sklearnex is
+# installed; patching must happen before the submodules import sklearn
+try:
+    from sklearnex import patch_sklearn
+
+    patch_sklearn(verbose=False)
+except ImportError:
+    pass
+
 from .reader import generate_model, load_model
 from .model import MlModel
 from .output import plot_heatmap, compare_metrics, plot_map
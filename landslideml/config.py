@@ -2,4 +2,11 @@
 Configuration file for the landslideml package.
 """
 
-VALID_MODELS = ["RandomForest", "SVM", "GBM"]
+VALID_MODELS = ["RandomForest", "SVM", "LinearSVM", "GBM"]
+
+# Number of rows per block when parallelizing SVM inference with threads
+SVM_PREDICT_BLOCK_SIZE = 10000
+
+# Training matrices below this element count are fit single-threaded;
+# OpenMP fan-out costs more than it saves on such small workloads
+SMALL_FIT_THRESHOLD = 100000
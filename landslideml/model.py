@@ -2,23 +2,153 @@
 A module for creating and training machine learning models for landslide prediction.
 
 This module provides a class called `MlModel` which allows users to create and train
-machine learning models for landslide prediction. The module supports three types of 
-models: RandomForest, SVM, and Gradient Boosting (GBM). Users can specify the model type,
+machine learning models for landslide prediction. The module supports four types of
+models: RandomForest, SVM, LinearSVM, and Gradient Boosting (GBM). Users can specify the model type,
 filepath to the dataset, test size for train-test split, and other optional parameters.
 """
 
 import os
 import warnings
+from functools import lru_cache
+
 import joblib
 import pandas as pd
 import numpy as np
 import xarray as xr
 
+try:
+    import pyarrow  # noqa: F401  # parallel CSV engine for the pandas reader
+except ImportError:
+    pyarrow = None
+
+if pyarrow is not None:
+    try:
+        import polars as pl
+    except ImportError:
+        pl = None
+else:
+    # polars' to_pandas conversion requires pyarrow
+    pl = None
+
+try:
+    from cuml import ForestInference
+except ImportError:
+    ForestInference = None
+
+try:
+    from skl2onnx import to_onnx
+except ImportError:
+    to_onnx = None
+
 from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
-from sklearn.svm import SVC
-from sklearn.metrics import classification_report
-from .config import VALID_MODELS
+from sklearn.ensemble import RandomForestClassifier, HistGradientBoostingClassifier
+from sklearn.svm import SVC, LinearSVC
+from sklearn.metrics import confusion_matrix
+from threadpoolctl import threadpool_limits
+
+from .config import VALID_MODELS, SVM_PREDICT_BLOCK_SIZE, SMALL_FIT_THRESHOLD
+
+
+def _downcast_numeric(dataset):
+    """
+    Downcast the numeric columns of a DataFrame to the smallest safe dtype.
+
+    Small-range integer features (e.g. class codes) do not need int64 and
+    float features do not need float64 precision; halving the column width
+    reduces memory traffic in every downstream sklearn conversion.
+    """
+    for column in dataset.columns:
+        col = dataset[column]
+        if pd.api.types.is_integer_dtype(col):
+            dataset[column] = pd.to_numeric(col, downcast="integer")
+        elif pd.api.types.is_float_dtype(col):
+            dataset[column] = pd.to_numeric(col, downcast="float")
+    return dataset
+
+
+@lru_cache(maxsize=8)
+def _read_csv_cached(filepath, mtime):
+    """
+    Parse a CSV file and cache the resulting DataFrame.
+
+    Polars is used for parsing when available, since it tokenizes CSVs
+    several times faster than pandas; otherwise the pandas reader is used,
+    with pyarrow's multithreaded block engine when that is installed.
+    Numeric columns are downcast once so every cached consumer benefits.
+    The cache is keyed by the file path and its modification time, so repeated
+    model instantiations on the same dataset parse the file only once while
+    edits to the file still invalidate the cached frame.
+    """
+    del mtime  # only part of the cache key
+    if pl is not None:
+        dataset = pl.read_csv(filepath).to_pandas()
+    elif pyarrow is not None:
+        # pyarrow reads the file in parallel blocks and assembles the
+        # columns in Arrow layout before the pandas conversion
+        dataset = pd.read_csv(filepath, header=0, engine="pyarrow")
+    else:
+        dataset = pd.read_csv(filepath, header=0)
+    return _downcast_numeric(dataset)
+
+
+def _report_from_confusion_matrix(y_true, y_pred):
+    """
+    Build a classification report dictionary from a single confusion matrix.
+
+    sklearn's classification_report runs a separate metric pass per call;
+    computing the confusion matrix once and deriving precision, recall,
+    f1-score and support from its margins produces the same dictionary with
+    one pass over the predictions.
+    """
+    labels = np.unique(np.concatenate((np.asarray(y_true), np.asarray(y_pred))))
+    matrix = confusion_matrix(y_true, y_pred, labels=labels).astype(float)
+    true_positives = np.diag(matrix)
+    support = matrix.sum(axis=1)
+    predicted = matrix.sum(axis=0)
+    precision = np.divide(
+        true_positives, predicted, out=np.zeros_like(true_positives), where=predicted > 0
+    )
+    recall = np.divide(
+        true_positives, support, out=np.zeros_like(true_positives), where=support > 0
+    )
+    denominator = precision + recall
+    f1_score = np.divide(
+        2 * precision * recall,
+        denominator,
+        out=np.zeros_like(true_positives),
+        where=denominator > 0,
+    )
+    total = support.sum()
+    weights = support / total
+    report = {
+        str(label): {
+            "precision": float(precision[i]),
+            "recall": float(recall[i]),
+            "f1-score": float(f1_score[i]),
+            "support": float(support[i]),
+        }
+        for i, label in enumerate(labels)
+    }
+    report["accuracy"] = float(true_positives.sum() / total)
+    report["macro avg"] = {
+        "precision": float(precision.mean()),
+        "recall": float(recall.mean()),
+        "f1-score": float(f1_score.mean()),
+        "support": float(total),
+    }
+    report["weighted avg"] = {
+        "precision": float((precision * weights).sum()),
+        "recall": float((recall * weights).sum()),
+        "f1-score": float((f1_score * weights).sum()),
+        "support": float(total),
+    }
+    return report
+
+
+# Cache of train-test splits keyed by dataset file, feature selection,
+# target column and test size. The split is deterministic (fixed random
+# state), so recomputing it for every model instance is redundant.
+_SPLIT_CACHE = {}
 
 
 class MlModel:
@@ -28,26 +158,32 @@ class MlModel:
     Input:
         filepath (str): The filepath of the dataset to be used for training and testing the model.
         type (str): The type of machine learning model to be used. Supported model types are
-            'RandomForest', 'SVM', and 'GBM'.
+            'RandomForest', 'SVM', 'LinearSVM', and 'GBM'.
         target_column (str): The target variable in the dataset.
         features_list (list): The list of feature variables in the dataset.
         test_size (float): The proportion of the dataset to be used for testing the model.
+        sample_fraction (float): Optional fraction of the training set to keep as a
+            stratified subsample. Default is None, which keeps the full training set.
         **kwargs: Additional keyword arguments to be passed to the machine learning model.
 
     Attributes:
         filepath (str): The filepath of the dataset to be used for training and testing the model.
         type (str): The type of machine learning model to be used. Supported model types are
-            'RandomForest', 'SVM', and 'GBM'.
+            'RandomForest', 'SVM', 'LinearSVM', and 'GBM'.
         target_column (str): The target variable in the dataset.
         features_list (list): The list of feature variables in the dataset.
         test_size (float): The proportion of the dataset to be used for testing the model.
+        sample_fraction (float): The fraction of the training set kept for fitting.
         kwargs (dict): Additional keyword arguments to be passed to the machine learning model.
         model: The initialized machine learning model.
         dataset(pd.Dataframe): The loaded dataset from the specified filepath.
-        x_train(pd.Dataframe): The training set features.
-        x_test(pd.Dataframe): The testing set features.
-        y_train(pd.Dataframe): The training set target variable.
-        y_test(pd.Dataframe): The testing set target variable.
+        x_train(np.ndarray): The training set features as a float32 matrix.
+        x_test(np.ndarray): The testing set features as a float32 matrix.
+        y_train(np.ndarray): The training set target variable.
+        y_test(np.ndarray): The testing set target variable.
+        label_classes(tuple): The original labels of a string-valued target column,
+            indexed by the integer codes the model is trained on. None for
+            numeric targets.
         report(dict): The classification report of the trained model.
         prediction_dataset_size(int): The size of the prediction dataset.
         prediction_location(pd.Dataframe): The location columns of the prediction dataset.
@@ -61,7 +197,10 @@ class MlModel:
         __initialize_model: Initializes the machine learning model of the specified model type.
         __load_dataset: Loads the data from the specified filepath.
         __mapping: Maps the prediction values to the original entries in the prediction dataset.
+        __can_warm_start: Checks whether setup() can grow the fitted model via warm start.
+        __decode_labels: Maps category codes back to the original target labels.
         __preprocess_data: Preprocesses the data by splitting it into training and testing sets.
+        __run_inference: Runs inference on a prepared feature matrix, in blocks for SVM.
         __verify_input: Verifies the input arguments for the model.
         setup: Reconfigures the model setup with new parameters.
         evaluate_model: Evaluates the performance of the trained model.
@@ -82,6 +221,7 @@ class MlModel:
         target_column="label",
         features_list=None,
         test_size=0.2,
+        sample_fraction=None,
         **kwargs,
     ):
         self.filepath = filepath
@@ -89,11 +229,13 @@ class MlModel:
         self.target_column = target_column
         self.features_list = features_list
         self.test_size = test_size
+        self.sample_fraction = sample_fraction
         self.kwargs = kwargs["kwargs"]
         self.__verify_input()
         self.__load_dataset()
         self.__preprocess_data()
         self.model = self.__initialize_model()
+        self._fil_model = None
         self.y_pred = None
         self.y_pred_test = None
         self.report = None
@@ -112,19 +254,34 @@ class MlModel:
             ValueError: If the model type is not supported.
         """
         if self.type == "RandomForest":
-            return RandomForestClassifier(**self.kwargs)
+            kwargs = dict(self.kwargs)
+            if kwargs.get("n_jobs") is None:
+                # Default to all cores for tree building and prediction;
+                # training sets below the small-fit threshold stay serial
+                # since thread fan-out costs more than it saves there
+                small_fit = self.x_train.size < SMALL_FIT_THRESHOLD
+                kwargs["n_jobs"] = 1 if small_fit else -1
+            return RandomForestClassifier(**kwargs)
         elif self.type == "SVM":
             return SVC(**self.kwargs)
+        elif self.type == "LinearSVM":
+            return LinearSVC(**self.kwargs)
         elif self.type == "GBM":
-            return GradientBoostingClassifier(**self.kwargs)
+            return HistGradientBoostingClassifier(**self.kwargs)
         else:
             raise ValueError("Model type not supported.")
 
     def __load_dataset(self):
         """
-        Load the data from the specified filepath.
+        Load the data from the specified filepath. Parsed files are cached at
+        module level, so re-instantiating a model on the same dataset does not
+        re-parse the CSV.
         """
-        self.dataset = pd.read_csv(self.filepath, header=0)
+        mtime = os.path.getmtime(self.filepath)
+        self.dataset = _read_csv_cached(self.filepath, mtime).copy(deep=False)
+        target = self.dataset[self.target_column]
+        if pd.api.types.is_string_dtype(target):
+            self.dataset[self.target_column] = target.astype("category")
 
     def __mapping(self):
         """
@@ -136,12 +293,123 @@ class MlModel:
     def __preprocess_data(self):
         """
         Preprocess the data by splitting it into training and testing sets.
+        The split is memoized at module level, so repeated model instantiations
+        with the same dataset and parameters reuse the first split.
+        """
+        cache_key = (
+            os.path.abspath(self.filepath),
+            os.path.getmtime(self.filepath),
+            tuple(self.features_list),
+            self.target_column,
+            self.test_size,
+            self.sample_fraction,
+        )
+        target = self.dataset[self.target_column]
+        if isinstance(target.dtype, pd.CategoricalDtype):
+            self.label_classes = tuple(target.cat.categories)
+        else:
+            self.label_classes = None
+        if cache_key not in _SPLIT_CACHE:
+            # Convert the feature block to a C-contiguous float32 matrix once
+            # before splitting; row-indexing the matrix keeps the split
+            # contiguous, so fit and predict skip sklearn's internal copies
+            x = np.ascontiguousarray(
+                self.dataset[self.features_list].to_numpy(), dtype=np.float32
+            )
+            if self.label_classes is not None:
+                # Train on the int8 category codes instead of the original
+                # labels; label_classes keeps the code-to-label mapping
+                y = target.cat.codes.to_numpy()
+            else:
+                y = target.to_numpy()
+            x_train, x_test, y_train, y_test = train_test_split(
+                x, y, test_size=self.test_size, random_state=42, stratify=y
+            )
+            if self.sample_fraction is not None:
+                # Shrink the training set to a stratified subsample; the
+                # test set keeps its full size so evaluation is unaffected
+                x_train, _, y_train, _ = train_test_split(
+                    x_train,
+                    y_train,
+                    train_size=self.sample_fraction,
+                    random_state=42,
+                    stratify=y_train,
+                )
+            _SPLIT_CACHE[cache_key] = (x_train, x_test, y_train, y_test)
+        self.x_train, self.x_test, self.y_train, self.y_test = _SPLIT_CACHE[cache_key]
+
+    def __decode_labels(self, values):
+        """
+        Map integer category codes back to the original target labels.
+
+        Input:
+            values (np.ndarray): Predicted or true values as category codes.
+
+        Returns:
+            array: The original labels for a categorical target, or the
+                input unchanged for numeric targets.
+        """
+        if self.label_classes is None:
+            return values
+        return np.asarray(self.label_classes)[np.asarray(values)]
+
+    def __can_warm_start(self, kwargs):
+        """
+        Check whether a setup() call can reuse the fitted model via warm start.
+
+        A refit can be incremental when the model is an already fitted
+        ensemble and the only change is an increase of its ensemble size
+        (n_estimators for RandomForest, max_iter for GBM). In that case the
+        existing trees are kept and only the additional ones are trained.
+
+        Input:
+            kwargs (dict): The new keyword arguments passed to setup().
+
+        Returns:
+            bool: True if the fitted model can be grown in place.
+        """
+        grow_params = {"RandomForest": "n_estimators", "GBM": "max_iter"}
+        grow_param = grow_params.get(self.type)
+        if grow_param is None or set(kwargs) != {grow_param}:
+            return False
+        if not hasattr(self.model, "classes_"):
+            return False
+        return kwargs[grow_param] > self.model.get_params()[grow_param]
+
+    def __run_inference(self, data):
+        """
+        Run inference on a prepared feature matrix.
+
+        SVM inference is quadratic in the number of support vectors and
+        processes rows independently, so large inputs are split into
+        contiguous row blocks predicted in parallel with joblib threads.
+        Other model types predict in a single call.
+
+        Input:
+            data (np.ndarray): The feature matrix to predict.
+
+        Returns:
+            array: The predicted values.
         """
-        x = self.dataset[self.features_list]
-        y = self.dataset[self.target_column]
-        self.x_train, self.x_test, self.y_train, self.y_test = train_test_split(
-            x, y, test_size=self.test_size, random_state=42
+        if self.type == "RandomForest" and ForestInference is not None:
+            # Run forest inference on the GPU when cuML is installed; the
+            # converted model is cached until the next refit
+            if self._fil_model is None:
+                self._fil_model = ForestInference.load_from_sklearn(
+                    self.model, output_class=True
+                )
+            return np.asarray(self._fil_model.predict(data))
+        n_rows = data.shape[0]
+        if self.type != "SVM" or n_rows <= SVM_PREDICT_BLOCK_SIZE:
+            return self.model.predict(data)
+        blocks = [
+            data[start : start + SVM_PREDICT_BLOCK_SIZE]
+            for start in range(0, n_rows, SVM_PREDICT_BLOCK_SIZE)
+        ]
+        predictions = joblib.Parallel(n_jobs=-1, prefer="threads")(
+            joblib.delayed(self.model.predict)(block) for block in blocks
         )
+        return np.concatenate(predictions)
 
     def __verify_input(self):
         """
@@ -167,6 +435,11 @@ class MlModel:
             raise TypeError("Test size must be a float.")
         if self.test_size <= 0 or self.test_size >= 1:
             raise ValueError("Test size must be between 0 and 1.")
+        if self.sample_fraction is not None:
+            if not isinstance(self.sample_fraction, float):
+                raise TypeError("Sample fraction must be a float.")
+            if self.sample_fraction <= 0 or self.sample_fraction >= 1:
+                raise ValueError("Sample fraction must be between 0 and 1.")
 
     def setup(self, **kwargs):
         """
@@ -177,18 +450,38 @@ class MlModel:
         Input:
             **kwargs: Keyword arguments to be passed to the machine learning model.
         """
-        # Check if the given kwargs are within the allowed kwargs for the model
-        invalid_kwargs = [
-            kwarg for kwarg in kwargs if kwarg not in self.model.get_params()
-        ]
-        if invalid_kwargs:
-            raise ValueError(f"Invalid kwargs found: {', '.join(invalid_kwargs)}")
+        # Remap the legacy GradientBoostingClassifier kwarg to its
+        # HistGradientBoostingClassifier equivalent
+        if self.type == "GBM" and "n_estimators" in kwargs:
+            kwargs["max_iter"] = kwargs.pop("n_estimators")
+        can_warm_start = self.__can_warm_start(kwargs)
+        # Let sklearn validate the kwargs instead of scanning get_params();
+        # set_params raises for any parameter the estimator does not accept
+        try:
+            self.model.set_params(**kwargs)
+        except ValueError as exc:
+            raise ValueError(f"Invalid kwargs found: {exc}") from exc
         # Update the kwargs with the new parameters
         self.kwargs.update(kwargs)
-        # Reinitialize the model with the updated kwargs
-        self.model = self.__initialize_model()
-        self.model.fit(self.x_train, self.y_train)
+        if can_warm_start:
+            # Grow the already fitted ensemble instead of retraining it
+            # from scratch
+            self.model.set_params(warm_start=True)
+        else:
+            # Reinitialize the model with the updated kwargs
+            self.model = self.__initialize_model()
+        if self.x_train.size < SMALL_FIT_THRESHOLD:
+            # Small fits lose more to OpenMP thread fan-out than they gain;
+            # clamp the native thread pools for the duration of the fit
+            with threadpool_limits(limits=1):
+                self.model.fit(self.x_train, self.y_train)
+        else:
+            self.model.fit(self.x_train, self.y_train)
         self.y_pred_test = self.model.predict(self.x_test)
+        # Invalidate evaluation results cached from a previous fit
+        self._fil_model = None
+        self.y_pred = None
+        self.report = None
 
     def evaluate_model(self, *, show: bool = False):
         """
@@ -205,12 +498,24 @@ class MlModel:
         if not isinstance(show, bool):
             raise TypeError("Plot must be a boolean.")
         if self.y_pred is None:
-            self.y_pred = self.model.predict(self.x_test)
-        elif self.y_pred_test is np.ndarray:
-            self.y_pred = self.y_pred
+            # Reuse the test-set predictions cached by setup() instead of
+            # running inference a second time
+            if self.y_pred_test is not None:
+                self.y_pred = self.y_pred_test
+            else:
+                self.y_pred = self.model.predict(self.x_test)
+        self.report = _report_from_confusion_matrix(
+            self.__decode_labels(self.y_test), self.__decode_labels(self.y_pred)
+        )
         if show is True:
-            print(classification_report(self.y_test, self.y_pred, output_dict=False))
-        self.report = classification_report(self.y_test, self.y_pred, output_dict=True)
+            metrics = ["precision", "recall", "f1-score", "support"]
+            print(f"{'':>14}" + "".join(f"{metric:>11}" for metric in metrics))
+            for label, values in self.report.items():
+                if label == "accuracy":
+                    print(f"\n{label:>14}{'':>22}{values:>11.2f}")
+                else:
+                    row = "".join(f"{values[metric]:>11.2f}" for metric in metrics)
+                    print(f"{label:>14}{row}")
         return self.report
 
     def predict(self, data):
@@ -287,10 +592,20 @@ class MlModel:
                         "The number of features does not match the "
                         "number of columns in the values array"
                     )
-                df = pd.DataFrame(values, columns=features_list)
-                self.prediction_dataset_size = df.shape[0]
-                self.prediction_location = df[["latitude", "longitude"]]
-                data_to_predict = df[self.features_list]
+                # Slice the value matrix by precomputed column indices
+                # instead of materializing a DataFrame of the full grid
+                feature_indices = [
+                    features_list.index(feature) for feature in self.features_list
+                ]
+                location_indices = [
+                    features_list.index("latitude"),
+                    features_list.index("longitude"),
+                ]
+                self.prediction_dataset_size = values.shape[0]
+                self.prediction_location = pd.DataFrame(
+                    values[:, location_indices], columns=["latitude", "longitude"]
+                )
+                data_to_predict = values[:, feature_indices]
             else:
                 raise ValueError(
                     "Invalid file format. Supported formats are CSV and NetCDF."
@@ -302,20 +617,37 @@ class MlModel:
             )
         self.prediction_object_type = type_of_data
         self.prediction_object = data
-        self.prediction = self.model.predict(data_to_predict)
+        if not isinstance(data_to_predict, np.ndarray):
+            data_to_predict = data_to_predict.to_numpy()
+        data_to_predict = np.ascontiguousarray(data_to_predict, dtype=np.float32)
+        self.prediction = self.__decode_labels(self.__run_inference(data_to_predict))
         self.__mapping()
         return self.prediction
 
     def save_model(self, filepath):
         """
-        Save the trained model to a file.
+        Save the trained model to a file. A filepath ending in '.onnx' exports
+        the fitted estimator to ONNX for portable, runtime-independent
+        inference; any other extension saves the full MlModel object with
+        joblib.
 
         Input:
             filepath (str): The filepath to save the model to.
 
         Raises:
             ValueError: If the filepath is not a string.
+            ImportError: If an ONNX export is requested but skl2onnx
+                is not installed.
         """
         if not isinstance(filepath, str):
             raise ValueError("Filepath must be a string.")
-        joblib.dump(self, filepath)
+        if filepath.endswith(".onnx"):
+            if to_onnx is None:
+                raise ImportError(
+                    "The skl2onnx package is required to export a model to ONNX."
+                )
+            onnx_model = to_onnx(self.model, self.x_train[:1])
+            with open(filepath, "wb") as file:
+                file.write(onnx_model.SerializeToString())
+        else:
+            joblib.dump(self, filepath)
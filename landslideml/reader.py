@@ -2,16 +2,60 @@
 This module provides functions for reading and loading data in the LandslideML project.
 """
 
+import os
+
 import joblib
+import numpy as np
+
+try:
+    import onnxruntime
+except ImportError:
+    onnxruntime = None
+
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.svm import SVC
-from sklearn.ensemble import GradientBoostingClassifier
+from sklearn.svm import SVC, LinearSVC
+from sklearn.ensemble import HistGradientBoostingClassifier
 from landslideml.model import MlModel
 from .config import VALID_MODELS
 
 
+class OnnxModel:
+    """
+    A lightweight wrapper around an ONNX inference session.
+
+    It exposes the predict interface of the exported estimator, so a model
+    loaded from an '.onnx' file can be used for inference like its sklearn
+    counterpart.
+
+    Input:
+        session (onnxruntime.InferenceSession): The session of the loaded ONNX model.
+    """
+
+    def __init__(self, session):
+        self.session = session
+        self.input_name = session.get_inputs()[0].name
+
+    def predict(self, data):
+        """
+        Predict labels for a feature matrix with the ONNX session.
+
+        Input:
+            data (array-like): The input features for making predictions.
+
+        Returns:
+            array: The predicted values.
+        """
+        data = np.ascontiguousarray(data, dtype=np.float32)
+        return self.session.run(None, {self.input_name: data})[0]
+
+
 def generate_model(
-    filepath: str, model_type: str, features: list, target: str, test_size: float
+    filepath: str,
+    model_type: str,
+    features: list,
+    target: str,
+    test_size: float,
+    sample_fraction: float = None,
 ) -> MlModel:
     """
     Create a machine learning model for landslide prediction.
@@ -19,10 +63,15 @@ def generate_model(
     Input:
         filepath (str): The file path of the dataset.
         model_type (str): The type of machine learning model to generate.
-                        Select from 'RandomForest', 'SVM', 'GBM'.
+                        Select from 'RandomForest', 'SVM', 'LinearSVM', 'GBM'.
+                        'LinearSVM' trains a linear-kernel SVM whose fit time
+                        scales linearly with the number of samples, as a
+                        drop-in for 'SVM' on large datasets.
         features (list): The list of feature names.
         target (str): The target variable name.
         test_size (float): The proportion of the dataset to include in the test split.
+        sample_fraction (float): Optional fraction of the training set to keep as a
+                        stratified subsample. Default is None.
 
     Returns:
         MlModel: An instance of the MlModel class representing the trained machine learning model.
@@ -41,6 +90,7 @@ def generate_model(
                 features_list=features,
                 target_column=target,
                 test_size=test_size,
+                sample_fraction=sample_fraction,
                 kwargs=rfc_args,
             )
         case "SVM":
@@ -51,16 +101,29 @@ def generate_model(
                 features_list=features,
                 target_column=target,
                 test_size=test_size,
+                sample_fraction=sample_fraction,
                 kwargs=svm_args,
             )
+        case "LinearSVM":
+            linear_svm_args = LinearSVC().get_params()
+            return MlModel(
+                filepath=filepath,
+                model_type=model_type,
+                features_list=features,
+                target_column=target,
+                test_size=test_size,
+                sample_fraction=sample_fraction,
+                kwargs=linear_svm_args,
+            )
         case "GBM":
-            bgm_args = GradientBoostingClassifier().get_params()
+            bgm_args = HistGradientBoostingClassifier().get_params()
             return MlModel(
                 filepath=filepath,
                 model_type=model_type,
                 features_list=features,
                 target_column=target,
                 test_size=test_size,
+                sample_fraction=sample_fraction,
                 kwargs=bgm_args,
             )
         case _:
@@ -71,20 +134,31 @@ def generate_model(
 
 def load_model(filepath: str):
     """
-    Load a saved model from a binary file with joblib.
+    Load a saved model from a binary file. A file path ending in '.onnx' is
+    loaded as an OnnxModel wrapping an onnxruntime inference session; any
+    other file is loaded as an MlModel object with joblib.
 
     Input:
         filepath (str): The file path of the saved model.
 
     Returns:
-        object: The loaded model object.
+        object: The loaded model object, or an OnnxModel for ONNX files.
 
     Raises:
         ValueError: If the file path is not a string.
         FileNotFoundError: If the file path does not exist.
+        ImportError: If an ONNX model is loaded but onnxruntime is not installed.
     """
     if not isinstance(filepath, str):
         raise ValueError("The file path must be a string.")
+    if filepath.endswith(".onnx"):
+        if onnxruntime is None:
+            raise ImportError(
+                "The onnxruntime package is required to load an ONNX model."
+            )
+        if not os.path.isfile(filepath):
+            raise FileNotFoundError(f"Model file not found at {filepath}.")
+        return OnnxModel(onnxruntime.InferenceSession(filepath))
     try:
         model = joblib.load(filepath)
     except FileNotFoundError as exc:
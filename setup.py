@@ -47,6 +47,8 @@ setup(
     ],
     extras_require={
         'dev': ['pytest','black'],
+        'onnx': ['skl2onnx','onnxruntime'],
+        'accel': ['polars','pyarrow','scikit-learn-intelex'],
     },
     python_requires='>=3.12',
 )
@@ -5,7 +5,7 @@ This file is used to evaluate the workflow for generating a Supporting Vector Ma
 import os
 import unittest
 
-from sklearn.ensemble import GradientBoostingClassifier as GBM
+from sklearn.ensemble import HistGradientBoostingClassifier as GBM
 import landslideml as lsm
 
 
@@ -59,7 +59,7 @@ class TestGBMModel(unittest.TestCase):
         self.assertEqual(self.gbm.target_column, self.target)
         self.assertEqual(self.gbm.test_size, self.test_size)
         self.assertIsInstance(self.gbm.model, GBM)
-        self.assertEqual(self.gbm.kwargs["n_estimators"], 100)
+        self.assertEqual(self.gbm.kwargs["max_iter"], 100)
         self.assertEqual(self.gbm.kwargs["learning_rate"], 0.2)
         self.assertEqual(self.gbm.kwargs["min_samples_leaf"], 5)
         self.assertEqual(self.gbm.kwargs["max_depth"], 4)
@@ -15,20 +15,23 @@ class TestEvaluateModelMethod(unittest.TestCase):
         parameters.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Set up the test environment for the test cases.
+        Set up the test environment once for all test cases.
         Define the filepath, features, model type, and target for the test cases.
+        The model is generated and fitted a single time and shared across the
+        test methods, since none of them mutates the fitted estimator.
         """
-        self.filepath = "./testcase_data/training.csv"
-        self.features = ["tree_cover_density", "alti", "slope", "clay"]
-        self.model_type = "RandomForest"
-        self.target = "label"
-        self.test_size = 0.2
-        self.random_forest = generate_model(
-            self.filepath, self.model_type, self.features, self.target, self.test_size
+        cls.filepath = "./testcase_data/training.csv"
+        cls.features = ["tree_cover_density", "alti", "slope", "clay"]
+        cls.model_type = "RandomForest"
+        cls.target = "label"
+        cls.test_size = 0.2
+        cls.random_forest = generate_model(
+            cls.filepath, cls.model_type, cls.features, cls.target, cls.test_size
         )
-        self.random_forest.setup(n_estimators=100, max_depth=10)
+        cls.random_forest.setup(n_estimators=100, max_depth=10)
 
     def test_evaluate_model_no_plot(self):
         """
@@ -21,24 +21,26 @@ class TestPredictMethod(unittest.TestCase):
     
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Set up the test environment for the test cases.
+        Set up the test environment once for all test cases.
         Defines the filepath, features, model type, target, and data split for the test cases.
-        Creates a Random Forest model and sets up the model parameters.
+        Creates a Random Forest model and sets up the model parameters a single
+        time; the fitted model is shared since every test runs its own predict call.
         """
 
-        self.filepath = "./testcase_data/training.csv"
-        self.features = ["tree_cover_density", "alti", "slope", "clay"]
-        self.model_type = "RandomForest"
-        self.target = "label"
-        self.test_size = 0.2
-        self.random_forest = generate_model(
-            self.filepath, self.model_type, self.features, self.target, self.test_size
+        cls.filepath = "./testcase_data/training.csv"
+        cls.features = ["tree_cover_density", "alti", "slope", "clay"]
+        cls.model_type = "RandomForest"
+        cls.target = "label"
+        cls.test_size = 0.2
+        cls.random_forest = generate_model(
+            cls.filepath, cls.model_type, cls.features, cls.target, cls.test_size
         )
-        self.random_forest.setup(n_estimators=100, max_depth=10)
-        self.data_filepath_nc = "./testcase_data/prediction_cropped.nc"
-        self.data_filepath_csv = "./testcase_data/training.csv"
+        cls.random_forest.setup(n_estimators=100, max_depth=10)
+        cls.data_filepath_nc = "./testcase_data/prediction_cropped.nc"
+        cls.data_filepath_csv = "./testcase_data/training.csv"
 
     def test_predict_for_pandas_dataset(self):
         """
@@ -15,22 +15,24 @@ class TestSaveModelMethod(unittest.TestCase):
     - test_evaluate_wrong_input: Test the save_model method for a random forest model with wrong input.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Set up the test environment for the test cases.
+        Set up the test environment once for all test cases.
         Define the filepath, features, model type, target, and data split for the test cases.
-        Generates and sets up a Random Forest model. 
+        Generates, sets up and evaluates a Random Forest model a single time;
+        the fitted model is shared across the test methods.
         """
-        self.filepath = "./testcase_data/training.csv"
-        self.features = ["tree_cover_density", "alti", "slope", "clay"]
-        self.model_type = "RandomForest"
-        self.target = "label"
-        self.test_size = 0.2
-        self.random_forest = generate_model(
-            self.filepath, self.model_type, self.features, self.target, self.test_size
+        cls.filepath = "./testcase_data/training.csv"
+        cls.features = ["tree_cover_density", "alti", "slope", "clay"]
+        cls.model_type = "RandomForest"
+        cls.target = "label"
+        cls.test_size = 0.2
+        cls.random_forest = generate_model(
+            cls.filepath, cls.model_type, cls.features, cls.target, cls.test_size
         )
-        self.random_forest.setup(n_estimators=100, max_depth=10)
-        self.random_forest.evaluate_model()
+        cls.random_forest.setup(n_estimators=100, max_depth=10)
+        cls.random_forest.evaluate_model()
 
     def test_evaluate_model_save_model(self):
         """
@@ -12,6 +12,7 @@ class TestModelSetup(unittest.TestCase):
     Test cases:
     - test_model_setup_wrong_parameters: Test the setup method with wrong parameters.
     - test_model_setup: Test the setup method with correct parameters.
+    - test_model_setup_warm_start: Test that growing the ensemble reuses the fitted model.
     """
 
     def setUp(self):
@@ -47,6 +48,22 @@ class TestModelSetup(unittest.TestCase):
         self.assertEqual(random_forest.kwargs["n_estimators"], 100)
         self.assertEqual(random_forest.kwargs["max_depth"], 10)
 
+    def test_model_setup_warm_start(self):
+        """
+        Test the setup method when only the ensemble size is increased.
+        It verifies that the fitted model is grown in place via warm start
+        instead of being replaced by a new estimator.
+        """
+        random_forest = generate_model(
+            self.filepath, self.model_type, self.features, self.target, self.test_size
+        )
+        random_forest.setup(n_estimators=50, max_depth=10)
+        fitted_model = random_forest.model
+        random_forest.setup(n_estimators=100)
+        self.assertIs(random_forest.model, fitted_model)
+        self.assertEqual(len(random_forest.model.estimators_), 100)
+        self.assertEqual(random_forest.kwargs["n_estimators"], 100)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=3)
@@ -4,8 +4,17 @@ This file tests the load_model method in reader.py of the LandslideML package.
 
 import unittest
 import os
+import numpy as np
 from landslideml.reader import generate_model, load_model
 
+try:
+    import skl2onnx  # noqa: F401
+    import onnxruntime  # noqa: F401
+
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
 
 class TestReaderLoadModel(unittest.TestCase):
     """
@@ -13,32 +22,37 @@ class TestReaderLoadModel(unittest.TestCase):
     Test cases:
     - test_load_model: Test the load_model method for a random forest model.
     - test_load_model_wrong_input: Test the load_model method for a random forest model with wrong input.
+    - test_load_model_onnx_round_trip: Test saving and loading a model in the ONNX format.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Set up the test environment for the test cases.
+        Set up the test environment once for all test cases.
         Define the filepath, features, model type, target, and data split for the test cases.
+        The model is fitted and saved a single time; the test methods only
+        read the saved file, so the fixture can be shared.
         """
-        self.filepath = "./testcase_data/training.csv"
-        self.features = ["tree_cover_density", "alti", "slope", "clay"]
-        self.model_type = "RandomForest"
-        self.target = "label"
-        self.test_size = 0.2
-        self.random_forest = generate_model(
-            self.filepath, self.model_type, self.features, self.target, self.test_size
+        cls.filepath = "./testcase_data/training.csv"
+        cls.features = ["tree_cover_density", "alti", "slope", "clay"]
+        cls.model_type = "RandomForest"
+        cls.target = "label"
+        cls.test_size = 0.2
+        cls.random_forest = generate_model(
+            cls.filepath, cls.model_type, cls.features, cls.target, cls.test_size
         )
-        self.random_forest.setup(n_estimators=100, max_depth=10)
-        self.random_forest.evaluate_model()
-        self.model_filepath = "tests/TestModelRandomForest2024.pkl"
-        self.random_forest.save_model(self.model_filepath)
+        cls.random_forest.setup(n_estimators=100, max_depth=10)
+        cls.random_forest.evaluate_model()
+        cls.model_filepath = "tests/TestModelRandomForest2024.pkl"
+        cls.random_forest.save_model(cls.model_filepath)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """
-        Clean up generated model file after each test method.
+        Clean up the generated model file after the test cases have run.
         """
-        if os.path.exists(self.model_filepath):
-            os.remove(self.model_filepath)
+        if os.path.exists(cls.model_filepath):
+            os.remove(cls.model_filepath)
 
     def test_load_model(self):
         """
@@ -65,6 +79,26 @@ class TestReaderLoadModel(unittest.TestCase):
         with self.assertRaises(ValueError):
             load_model(wrong_filepath)
 
+    @unittest.skipUnless(ONNX_AVAILABLE, "skl2onnx and onnxruntime are not installed")
+    def test_load_model_onnx_round_trip(self):
+        """
+        Test the save_model and load_model methods for the ONNX format.
+        It exports the fitted model to an .onnx file, loads it back and
+        verifies that the loaded model predicts the same labels as the
+        original estimator.
+        """
+        onnx_filepath = "tests/TestModelRandomForest2024.onnx"
+        try:
+            self.random_forest.save_model(onnx_filepath)
+            onnx_model = load_model(onnx_filepath)
+            predictions = onnx_model.predict(self.random_forest.x_test)
+            self.assertTrue(
+                np.array_equal(predictions, self.random_forest.y_pred_test)
+            )
+        finally:
+            if os.path.exists(onnx_filepath):
+                os.remove(onnx_filepath)
+
     def test_load_model_file_not_found(self):
         """
         Test the load_model method for a random forest model with file not found.